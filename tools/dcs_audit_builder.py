@@ -8,22 +8,43 @@ PromptCore Alignment: v3.7
 """
 
 import os
+import re
+import atexit
 import sys
+import time
 import json
+import shutil
 import hashlib
 import zipfile
+import zlib
+import queue
+import socket
 import logging
+import logging.handlers
+import codecs
 import argparse
+import functools
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from pathlib import Path
 from datetime import datetime, timezone
 from dataclasses import dataclass, field
-from typing import Optional
+from typing import Iterator, Optional
+
+try:
+    import orjson
+except ImportError:  # Optional: stdlib json is used as a fallback
+    orjson = None
+
+try:
+    from blake3 import blake3
+except ImportError:  # Optional: only needed for checksum_algo="blake3"
+    blake3 = None
 
 # ═══════════════════════════════════════════════════════════════════════════════
 # CONFIGURATION
 # ═══════════════════════════════════════════════════════════════════════════════
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class BuildConfig:
     """Immutable build configuration."""
     version: str = "1.0.0-enterprise"
@@ -31,34 +52,103 @@ class BuildConfig:
     domain: str = "https://www.nextara-ai-solutions.com"
     page_slug: str = "digital-credibility-score-audit"
     encoding: str = "utf-8"
-    zip_compression: int = zipfile.ZIP_DEFLATED
+    minify_css: bool = False
+    
+    # Archive compression: "deflate" (portable) or "zstd" (Python 3.14+)
+    compression_backend: str = "deflate"
+    deflate_level: int = zlib.Z_DEFAULT_COMPRESSION
+    zstd_level: int = 15  # 1-5 dev, 10-15 default, 19-22 archival
+    zip_compression: Optional[int] = None  # Explicit zipfile.ZIP_* method; overrides the backend
     
     # Validation thresholds
     min_astro_size: int = 5000  # bytes
     min_css_size: int = 500
     required_schema_types: tuple = ("WebPage", "Service", "FAQPage")
+    
+    # Worker processes for content generation (1 = generate in-process)
+    jobs: int = 1
+    
+    # Manifest checksum algorithm: "sha256" (verifiable with sha256sum) or "blake3"
+    checksum_algo: str = "sha256"
+    
+    # Skip the build when on-disk outputs still match the cached manifest
+    incremental: bool = False
+    
+    def __post_init__(self):
+        # Any iterable is accepted; sets are sorted so check order is stable across hash seeds
+        types = self.required_schema_types
+        if isinstance(types, (set, frozenset)):
+            types = sorted(types)
+        object.__setattr__(self, "required_schema_types", tuple(types))
 
 
-@dataclass
+@dataclass(slots=True)
 class BuildManifest:
     """Tracks all generated artifacts for reproducibility."""
     version: str
     promptcore_ver: str
     generated_at: str
     hostname: str
+    checksum_algo: str = "sha256"
     artifacts: dict = field(default_factory=dict)
     checksums: dict = field(default_factory=dict)
     validation: dict = field(default_factory=dict)
+    # Encoded artifact bytes keyed by path relative to the output dir (not serialized)
+    payloads: dict = field(default_factory=dict, repr=False)
+
+
+@dataclass(slots=True)
+class EncodedArtifact:
+    """Generated text paired with its encoded bytes, so it is encoded only once."""
+    text: str
+    data: bytes
+
+
+def encode_artifact(text: str, encoding: str) -> EncodedArtifact:
+    """Encode text once and carry both forms together."""
+    return EncodedArtifact(text, text.encode(encoding))
+
+
+# Resolved once per process; env vars like HOSTNAME are often unset in containers
+try:
+    _HOSTNAME = socket.gethostname() or "unknown"
+except OSError:
+    _HOSTNAME = "unknown"
+
+# Manifests of previous builds, keyed by config + output dir + template contents
+_BUILD_CACHE_DIR = Path.home() / ".cache" / "nextara-dcs-builder" / "builds"
 
 
 # ═══════════════════════════════════════════════════════════════════════════════
 # LOGGING
 # ═══════════════════════════════════════════════════════════════════════════════
 
+class BufferedFileHandler(logging.StreamHandler):
+    """File handler that lets a 64 KiB buffer batch writes instead of flushing per record."""
+    
+    def __init__(self, path: Path, encoding: str = "utf-8", buffer_size: int = 64 * 1024):
+        super().__init__(open(path, "a", encoding=encoding, buffering=buffer_size))
+        atexit.register(self.flush)
+    
+    def emit(self, record: logging.LogRecord) -> None:
+        try:
+            self.stream.write(self.format(record) + self.terminator)
+        except Exception:
+            self.handleError(record)
+    
+    def close(self) -> None:
+        with self.lock:
+            if not self.stream.closed:
+                self.stream.flush()
+                self.stream.close()
+        super().close()
+
+
 def setup_logging(log_path: Optional[Path] = None) -> logging.Logger:
     """Configure structured logging with optional file output."""
     logger = logging.getLogger("dcs-builder")
-    logger.setLevel(logging.DEBUG)
+    # Only DEBUG when a sink wants it, so isEnabledFor() guards can skip work
+    logger.setLevel(logging.DEBUG if log_path else logging.INFO)
     
     fmt = logging.Formatter(
         "[%(asctime)s] [%(levelname)s] %(message)s",
@@ -71,10 +161,17 @@ def setup_logging(log_path: Optional[Path] = None) -> logging.Logger:
     logger.addHandler(console)
     
     if log_path:
-        file_handler = logging.FileHandler(log_path, encoding="utf-8")
+        file_handler = BufferedFileHandler(log_path, encoding="utf-8")
         file_handler.setLevel(logging.DEBUG)
         file_handler.setFormatter(fmt)
-        logger.addHandler(file_handler)
+        # File writes happen on the listener thread, off the build path
+        log_queue = queue.SimpleQueue()
+        queue_handler = logging.handlers.QueueHandler(log_queue)
+        queue_handler.setLevel(logging.DEBUG)
+        logger.addHandler(queue_handler)
+        listener = logging.handlers.QueueListener(log_queue, file_handler)
+        listener.start()
+        atexit.register(listener.stop)
     
     return logger
 
@@ -83,9 +180,7 @@ def setup_logging(log_path: Optional[Path] = None) -> logging.Logger:
 # CONTENT GENERATORS
 # ═══════════════════════════════════════════════════════════════════════════════
 
-def generate_astro_content(config: BuildConfig) -> str:
-    """Generate the Astro page content."""
-    return '''---
+_ASTRO_TEMPLATE: str = '''---
 import BaseLayout from '../layouts/BaseLayout.astro';
 
 const pageTitle = 'Digital Credibility Score Audit | NexTara AI Solutions';
@@ -463,11 +558,36 @@ const pageDescription =
 '''
 
 
-def generate_schema(config: BuildConfig) -> dict:
-    """Generate JSON-LD schema for the audit page."""
-    base_url = f"{config.domain}/{config.page_slug}"
+_ASTRO_BYTES: bytes = _ASTRO_TEMPLATE.encode("utf-8")
+
+
+def _is_utf8(encoding: str) -> bool:
+    return codecs.lookup(encoding).name == "utf-8"
+
+
+def generate_astro_content(config: BuildConfig) -> str:
+    """Generate the Astro page content."""
+    return _ASTRO_TEMPLATE
+
+
+def generate_astro_bytes(config: BuildConfig) -> bytes:
+    """Generate the Astro page content encoded with config.encoding."""
+    if _is_utf8(config.encoding):
+        return _ASTRO_BYTES
+    return _ASTRO_TEMPLATE.encode(config.encoding)
+
+
+_SCHEMA_CONTEXT = "https://schema.org"
+
+
+def _build_schema(domain: str, page_slug: str) -> dict:
+    base_url = f"{domain}/{page_slug}"
+    website_id = f"{domain}/#website"
+    hero_id = f"{domain}/#dcs-audit-hero-image"
+    service_id = f"{domain}/#dcs-audit-service"
+    faq_id = f"{domain}/#dcs-audit-faq"
     return {
-        "@context": "https://schema.org",
+        "@context": _SCHEMA_CONTEXT,
         "@graph": [
             {
                 "@type": "WebPage",
@@ -475,15 +595,15 @@ def generate_schema(config: BuildConfig) -> dict:
                 "url": base_url,
                 "name": "Digital Credibility Score Audit | NexTara AI Solutions",
                 "description": "Request a Digital Credibility Score Audit to understand whether your current website can realistically reach a DCS 900+ standard.",
-                "isPartOf": {"@id": f"{config.domain}/#website"},
+                "isPartOf": {"@id": website_id},
                 "primaryImageOfPage": {
                     "@type": "ImageObject",
-                    "@id": f"{config.domain}/#dcs-audit-hero-image"
+                    "@id": hero_id
                 }
             },
             {
                 "@type": "Service",
-                "@id": f"{config.domain}/#dcs-audit-service",
+                "@id": service_id,
                 "name": "Digital Credibility Score Audit",
                 "provider": {"@type": "Organization", "name": "NexTara AI Solutions"},
                 "description": "A governance-grade diagnostic that evaluates your website across five pillars of the Digital Credibility Score framework.",
@@ -491,7 +611,7 @@ def generate_schema(config: BuildConfig) -> dict:
             },
             {
                 "@type": "FAQPage",
-                "@id": f"{config.domain}/#dcs-audit-faq",
+                "@id": faq_id,
                 "mainEntity": [
                     {
                         "@type": "Question",
@@ -531,9 +651,47 @@ def generate_schema(config: BuildConfig) -> dict:
     }
 
 
-def generate_css() -> str:
-    """Generate CSS styles for the audit page."""
-    return '''/* ═══════════════════════════════════════════════════════════════════════════
+def generate_schema(config: BuildConfig) -> dict:
+    """Generate JSON-LD schema for the audit page."""
+    return _build_schema(config.domain, config.page_slug)
+
+
+def dumps_json_bytes(obj) -> bytes:
+    """Serialize to UTF-8 JSON with two-space indentation (orjson when available)."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+    return json.dumps(obj, indent=2, ensure_ascii=False).encode("utf-8")
+
+
+def dumps_schema(schema: dict) -> str:
+    """Serialize JSON-LD schema with two-space indentation."""
+    return dumps_json_bytes(schema).decode("utf-8")
+
+
+# Serialized schema skeleton; placeholders are swapped for JSON-escaped values
+_SCHEMA_DOMAIN_MARK = "__DCS_DOMAIN__"
+_SCHEMA_SLUG_MARK = "__DCS_SLUG__"
+_SCHEMA_TEMPLATE_BYTES: bytes = dumps_schema(
+    _build_schema(_SCHEMA_DOMAIN_MARK, _SCHEMA_SLUG_MARK)
+).encode("utf-8")
+
+
+def _json_escape(value: str) -> bytes:
+    return json.dumps(value, ensure_ascii=False)[1:-1].encode("utf-8")
+
+
+def generate_schema_bytes(config: BuildConfig) -> bytes:
+    """Generate the serialized JSON-LD schema encoded with config.encoding."""
+    if not _is_utf8(config.encoding):
+        return dumps_schema(generate_schema(config)).encode(config.encoding)
+    return (
+        _SCHEMA_TEMPLATE_BYTES
+        .replace(_SCHEMA_SLUG_MARK.encode("utf-8"), _json_escape(config.page_slug))
+        .replace(_SCHEMA_DOMAIN_MARK.encode("utf-8"), _json_escape(config.domain))
+    )
+
+
+_CSS_CONTENT: str = '''/* ═══════════════════════════════════════════════════════════════════════════
    DCS Audit Landing Page Styles — NexTara AI Solutions
    Version: 1.0.0 | PromptCore v3.7 Aligned
    ═══════════════════════════════════════════════════════════════════════════ */
@@ -686,13 +844,54 @@ def generate_css() -> str:
 '''
 
 
-def generate_readme(config: BuildConfig) -> str:
-    """Generate implementation README."""
-    return f'''# Digital Credibility Score Audit — Implementation Package
+# Quoted strings and unquoted url(...) values are copied through untouched
+_CSS_LITERAL = r"""(?P<lit>"(?:[^"\\]|\\.)*"|'(?:[^'\\]|\\.)*'|url\((?!\s*["'])[^)]*\))"""
+_CSS_COMMENT_RE = re.compile(_CSS_LITERAL + r"|/\*.*?\*/", re.DOTALL | re.IGNORECASE)
+_CSS_SPACE_RE = re.compile(
+    _CSS_LITERAL + r"|(?P<semi>\s*;\s*(?=\}))|\s*(?P<punct>[{};,>])\s*|(?P<ws>\s+)",
+    re.DOTALL | re.IGNORECASE
+)
 
-**Version:** {config.version}
-**PromptCore Alignment:** {config.promptcore_ver}
-**Generated:** {datetime.now(timezone.utc).isoformat()}
+
+def _minify_css_token(match: re.Match) -> str:
+    kind = match.lastgroup
+    if kind == "lit" or kind == "punct":
+        return match.group(kind)
+    return " " if kind == "ws" else ""
+
+
+def _minify_css(css: str) -> str:
+    """Strip comments and collapse whitespace, leaving strings and url() intact.
+    
+    Stdlib-only on purpose: --minify-css output (and so its manifest checksum)
+    must not depend on which optional packages are installed.
+    """
+    css = _CSS_COMMENT_RE.sub(lambda m: m.group("lit") or "", css)
+    return _CSS_SPACE_RE.sub(_minify_css_token, css).strip()
+
+
+_CSS_BYTES: bytes = _CSS_CONTENT.encode("utf-8")
+_CSS_MIN_CONTENT: str = _minify_css(_CSS_CONTENT)
+_CSS_MIN_BYTES: bytes = _CSS_MIN_CONTENT.encode("utf-8")
+
+
+def generate_css(minify: bool = False) -> str:
+    """Generate CSS styles for the audit page."""
+    return _CSS_MIN_CONTENT if minify else _CSS_CONTENT
+
+
+def generate_css_bytes(config: BuildConfig) -> bytes:
+    """Generate CSS styles encoded with config.encoding."""
+    if _is_utf8(config.encoding):
+        return _CSS_MIN_BYTES if config.minify_css else _CSS_BYTES
+    return generate_css(config.minify_css).encode(config.encoding)
+
+
+_README_TEMPLATE: str = '''# Digital Credibility Score Audit — Implementation Package
+
+**Version:** {version}
+**PromptCore Alignment:** {promptcore_ver}
+**Generated:** {generated_at}
 
 ## Contents
 
@@ -722,6 +921,38 @@ site settings.
 '''
 
 
+def generate_readme(config: BuildConfig, generated_at: Optional[str] = None) -> str:
+    """Generate implementation README."""
+    if generated_at is None:
+        generated_at = datetime.now(timezone.utc).isoformat(timespec="seconds")
+    return _README_TEMPLATE.format_map({
+        "version": config.version,
+        "promptcore_ver": config.promptcore_ver,
+        "generated_at": generated_at,
+    })
+
+
+def generate_all(config: BuildConfig, generated_at: str) -> tuple:
+    """Generate (astro, schema, css, readme), fanning out to processes if config.jobs > 1."""
+    if config.jobs <= 1:
+        return (
+            generate_astro_content(config),
+            generate_schema(config),
+            generate_css(config.minify_css),
+            generate_readme(config, generated_at),
+        )
+    
+    workers = min(4, config.jobs, os.cpu_count() or 1)
+    with ProcessPoolExecutor(max_workers=workers) as ex:
+        futures = (
+            ex.submit(generate_astro_content, config),
+            ex.submit(generate_schema, config),
+            ex.submit(generate_css, config.minify_css),
+            ex.submit(generate_readme, config, generated_at),
+        )
+        return tuple(f.result() for f in futures)
+
+
 # ═══════════════════════════════════════════════════════════════════════════════
 # VALIDATION
 # ═══════════════════════════════════════════════════════════════════════════════
@@ -731,121 +962,309 @@ class ValidationError(Exception):
     pass
 
 
-def validate_astro(content: str, config: BuildConfig) -> dict:
+# Required literals, matched in a single bytes-mode regex pass per artifact
+_ASTRO_REQUIRED = (b"<main>", b"</main>", b"BaseLayout", b"hero-section", b"audit-form")
+_ASTRO_REQ_RE = re.compile(
+    b"|".join(map(re.escape, _ASTRO_REQUIRED)) + rb"|(?P<label>(?i:label\s+for=))"
+)
+_CSS_REQUIRED = (b".audit-summary-grid", b".risk-grid", b".faq-list", b".audit-form")
+_CSS_REQ_RE = re.compile(b"|".join(map(re.escape, _CSS_REQUIRED)))
+
+
+_PASS = sys.intern("PASS")
+_FAIL = sys.intern("FAIL")
+
+
+def _literal_checks(required: tuple) -> tuple:
+    """Pair each required literal with its precomputed, interned PASS/FAIL messages."""
+    return tuple(
+        (lit,
+         sys.intern(f"{_PASS}: Contains '{lit.decode('ascii')}'"),
+         sys.intern(f"{_FAIL}: Missing '{lit.decode('ascii')}'"))
+        for lit in required
+    )
+
+
+_ASTRO_CHECKS = _literal_checks(_ASTRO_REQUIRED)
+_CSS_CHECKS = _literal_checks(_CSS_REQUIRED)
+
+_LABELS_PASS = sys.intern(f"{_PASS}: Form labels present")
+_LABELS_FAIL = sys.intern(f"{_FAIL}: Missing form labels")
+_CONTEXT_PASS = sys.intern(f"{_PASS}: Valid @context")
+_CONTEXT_FAIL = sys.intern(f"{_FAIL}: Invalid @context")
+
+
+@functools.lru_cache(maxsize=8)
+def _schema_type_checks(required_types: tuple) -> tuple:
+    """The required @types as a frozenset, plus interned PASS/FAIL messages in declared order."""
+    return frozenset(required_types), tuple(
+        (req_type,
+         sys.intern(f"{_PASS}: Contains {req_type}"),
+         sys.intern(f"{_FAIL}: Missing {req_type}"))
+        for req_type in required_types
+    )
+
+
+def _scan_bytes(artifact: EncodedArtifact, config: BuildConfig) -> bytes:
+    """Bytes to scan for the ASCII literals above (UTF-8 unless already so)."""
+    if _is_utf8(config.encoding):
+        return artifact.data
+    return artifact.text.encode("utf-8")
+
+
+def validate_astro(artifact: EncodedArtifact, config: BuildConfig) -> dict:
     """Validate Astro content meets requirements."""
-    results = {"passed": True, "checks": []}
+    if isinstance(artifact, str):
+        artifact = encode_artifact(artifact, config.encoding)
+    # Size check, one entry per required literal, label check — sized up front
+    checks = [None] * (len(_ASTRO_CHECKS) + 2)
+    passed = True
     
     # Size check
-    size = len(content.encode(config.encoding))
+    size = len(artifact.data)
     if size < config.min_astro_size:
-        results["passed"] = False
-        results["checks"].append(f"FAIL: Size {size}B < {config.min_astro_size}B minimum")
+        passed = False
+        checks[0] = f"{_FAIL}: Size {size}B < {config.min_astro_size}B minimum"
     else:
-        results["checks"].append(f"PASS: Size {size}B")
+        checks[0] = f"{_PASS}: Size {size}B"
     
     # Required elements
-    required = ["<main>", "</main>", "BaseLayout", "hero-section", "audit-form"]
-    for elem in required:
-        if elem in content:
-            results["checks"].append(f"PASS: Contains '{elem}'")
+    found = set()
+    has_labels = False
+    for match in _ASTRO_REQ_RE.finditer(_scan_bytes(artifact, config)):
+        if match.lastgroup == "label":
+            has_labels = True
         else:
-            results["passed"] = False
-            results["checks"].append(f"FAIL: Missing '{elem}'")
+            found.add(match.group())
+    checks[1:-1] = [ok if lit in found else fail for lit, ok, fail in _ASTRO_CHECKS]
+    if not found.issuperset(_ASTRO_REQUIRED):
+        passed = False
     
     # Accessibility checks
-    if 'label for=' in content.lower() or 'label for="' in content:
-        results["checks"].append("PASS: Form labels present")
+    if has_labels:
+        checks[-1] = _LABELS_PASS
     else:
-        results["passed"] = False
-        results["checks"].append("FAIL: Missing form labels")
+        passed = False
+        checks[-1] = _LABELS_FAIL
     
-    return results
+    return {"passed": passed, "checks": checks}
 
 
 def validate_schema(schema: dict, config: BuildConfig) -> dict:
     """Validate JSON-LD schema structure."""
-    results = {"passed": True, "checks": []}
+    checks = [None] * (len(config.required_schema_types) + 1)
+    passed = True
     
     # Check @context
-    if schema.get("@context") == "https://schema.org":
-        results["checks"].append("PASS: Valid @context")
+    if schema.get("@context") == _SCHEMA_CONTEXT:
+        checks[0] = _CONTEXT_PASS
     else:
-        results["passed"] = False
-        results["checks"].append("FAIL: Invalid @context")
+        passed = False
+        checks[0] = _CONTEXT_FAIL
     
     # Check required types
+    required, type_checks = _schema_type_checks(config.required_schema_types)
     graph = schema.get("@graph", [])
     found_types = {item.get("@type") for item in graph}
+    missing = required - found_types
+    if missing:
+        passed = False
     
-    for req_type in config.required_schema_types:
-        if req_type in found_types:
-            results["checks"].append(f"PASS: Contains {req_type}")
-        else:
-            results["passed"] = False
-            results["checks"].append(f"FAIL: Missing {req_type}")
+    checks[1:] = [fail if req_type in missing else ok for req_type, ok, fail in type_checks]
     
-    return results
+    return {"passed": passed, "checks": checks}
 
 
-def validate_css(content: str, config: BuildConfig) -> dict:
+def validate_css(artifact: EncodedArtifact, config: BuildConfig) -> dict:
     """Validate CSS content."""
-    results = {"passed": True, "checks": []}
+    if isinstance(artifact, str):
+        artifact = encode_artifact(artifact, config.encoding)
+    checks = [None] * (len(_CSS_CHECKS) + 1)
+    passed = True
     
-    size = len(content.encode(config.encoding))
+    size = len(artifact.data)
     if size < config.min_css_size:
-        results["passed"] = False
-        results["checks"].append(f"FAIL: Size {size}B < {config.min_css_size}B minimum")
+        passed = False
+        checks[0] = f"{_FAIL}: Size {size}B < {config.min_css_size}B minimum"
     else:
-        results["checks"].append(f"PASS: Size {size}B")
+        checks[0] = f"{_PASS}: Size {size}B"
     
     # Required selectors
-    required = [".audit-summary-grid", ".risk-grid", ".faq-list", ".audit-form"]
-    for sel in required:
-        if sel in content:
-            results["checks"].append(f"PASS: Contains '{sel}'")
-        else:
-            results["passed"] = False
-            results["checks"].append(f"FAIL: Missing '{sel}'")
+    found = set(_CSS_REQ_RE.findall(_scan_bytes(artifact, config)))
+    checks[1:] = [ok if lit in found else fail for lit, ok, fail in _CSS_CHECKS]
+    if not found.issuperset(_CSS_REQUIRED):
+        passed = False
     
-    return results
+    return {"passed": passed, "checks": checks}
 
 
 # ═══════════════════════════════════════════════════════════════════════════════
 # BUILD FUNCTIONS
 # ═══════════════════════════════════════════════════════════════════════════════
 
+def compute_checksum_bytes(data) -> str:
+    """SHA-256 hex digest via OpenSSL (SHA-NI accelerated where available).
+    
+    Accepts any buffer (bytes, memoryview); hashlib reads it in place without
+    copying and releases the GIL for inputs over 2 KiB.
+    """
+    return hashlib.sha256(data, usedforsecurity=False).hexdigest()
+
+
+def artifact_checksum(data, config: BuildConfig) -> str:
+    """Checksum an artifact with the manifest algorithm selected in config."""
+    if config.checksum_algo == "sha256":
+        return compute_checksum_bytes(data)
+    if config.checksum_algo == "blake3":
+        if blake3 is None:
+            raise ValueError("checksum_algo 'blake3' requires the blake3 package")
+        return blake3(data, max_threads=blake3.AUTO).hexdigest()
+    raise ValueError(f"Unknown checksum algorithm: {config.checksum_algo}")
+
+
 def compute_checksum(content: str, encoding: str = "utf-8") -> str:
     """Compute SHA-256 checksum of content."""
-    return hashlib.sha256(content.encode(encoding)).hexdigest()
+    return compute_checksum_bytes(content.encode(encoding))
 
 
-def safe_write(path: Path, content: str, encoding: str, logger: logging.Logger) -> int:
-    """Safely write content to file with error handling."""
+_WRITE_BUFFER_SIZE = 128 * 1024
+# O_SEQUENTIAL is a Windows-only access-pattern hint; O_BINARY avoids newline translation
+_WRITE_FLAGS = (os.O_WRONLY | os.O_CREAT | os.O_TRUNC
+                | getattr(os, "O_BINARY", 0) | getattr(os, "O_SEQUENTIAL", 0))
+
+
+def _write_buffered(path: Path, data: bytes) -> None:
+    """Write bytes through a 128 KiB buffer, hinting sequential access where supported."""
+    fd = os.open(path, _WRITE_FLAGS, 0o666)
+    with os.fdopen(fd, "wb", buffering=_WRITE_BUFFER_SIZE) as f:
+        f.write(data)
+
+
+@functools.lru_cache(maxsize=1)
+def _template_fingerprint() -> str:
+    # The minified CSS is hashed as output, so a minifier change also invalidates
+    return compute_checksum_bytes(b"\0".join((
+        _ASTRO_BYTES, _CSS_BYTES, _CSS_MIN_BYTES, _SCHEMA_TEMPLATE_BYTES,
+        _README_TEMPLATE.encode("utf-8")
+    )))
+
+
+# BuildConfig fields that change the written files; jobs and ZIP settings do not
+_OUTPUT_FIELDS = (
+    "version", "promptcore_ver", "domain", "page_slug", "encoding", "minify_css",
+    "min_astro_size", "min_css_size", "required_schema_types", "checksum_algo",
+)
+
+
+def _build_cache_path(output_dir: Path, config: BuildConfig) -> Path:
+    ident = {name: getattr(config, name) for name in _OUTPUT_FIELDS}
+    ident["output_dir"] = str(output_dir.resolve())
+    ident["templates"] = _template_fingerprint()
+    key = compute_checksum_bytes(json.dumps(ident, sort_keys=True).encode("utf-8"))[:16]
+    return _BUILD_CACHE_DIR / f"{key}.manifest.json"
+
+
+def load_cached_build(output_dir: Path, config: BuildConfig) -> Optional[BuildManifest]:
+    """Return the cached manifest if every artifact on disk still matches its checksum."""
+    try:
+        cached_bytes = _build_cache_path(output_dir, config).read_bytes()
+        cached = json.loads(cached_bytes)
+        manifest = BuildManifest(
+            version=cached["version"],
+            promptcore_ver=cached["promptcore_ver"],
+            generated_at=cached["generated_at"],
+            hostname=cached["hostname"],
+            checksum_algo=cached.get("checksum_algo", "sha256"),
+            artifacts=cached["artifacts"],
+            checksums=cached["checksums"],
+            validation=cached["validation"]
+        )
+        for key, artifact in manifest.artifacts.items():
+            path = Path(artifact)
+            data = path.read_bytes()
+            if artifact_checksum(data, config) != manifest.checksums.get(key):
+                return None
+            manifest.payloads[path.relative_to(output_dir).as_posix()] = data
+        manifest_path = output_dir / "build-manifest.json"
+        manifest_bytes = manifest_path.read_bytes()
+        if manifest_bytes != cached_bytes:
+            return None
+        manifest.payloads[manifest_path.name] = manifest_bytes
+    except (OSError, ValueError, KeyError):
+        return None
+    return manifest
+
+
+def store_cached_build(output_dir: Path, config: BuildConfig, manifest_bytes: bytes) -> None:
+    """Record a finished build's manifest for later incremental runs (best-effort)."""
+    try:
+        _BUILD_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        _build_cache_path(output_dir, config).write_bytes(manifest_bytes)
+    except OSError:
+        pass
+
+
+def safe_write_bytes(path: Path, data: bytes, logger: logging.Logger) -> int:
+    """Safely write pre-encoded bytes to file with error handling.
+    
+    Writes go to a sibling temp file that is renamed over the target, so a
+    hardlinked backup of the previous build keeps its own contents. The
+    target is always replaced by a new regular file: a symlink at ``path``
+    is replaced rather than followed, and the previous file's mode is not
+    carried over.
+    """
     try:
         path.parent.mkdir(parents=True, exist_ok=True)
-        path.write_text(content, encoding=encoding)
-        size = path.stat().st_size
-        logger.info(f"Wrote {path.name} ({size:,} bytes)")
+        tmp_path = path.with_name(f".{path.name}.tmp")
+        try:
+            _write_buffered(tmp_path, data)
+            os.replace(tmp_path, path)
+        except BaseException:
+            try:
+                tmp_path.unlink(missing_ok=True)
+            except OSError:
+                pass
+            raise
+        size = len(data)
+        logger.info("Wrote %s (%s bytes)", path.name, format(size, ","))
         return size
     except PermissionError as e:
-        logger.error(f"Permission denied writing {path}: {e}")
+        logger.error("Permission denied writing %s: %s", path, e)
         raise
     except OSError as e:
-        logger.error(f"OS error writing {path}: {e}")
+        logger.error("OS error writing %s: %s", path, e)
         raise
 
 
+def safe_write(path: Path, content: str, encoding: str, logger: logging.Logger) -> int:
+    """Safely write content to file with error handling."""
+    return safe_write_bytes(path, content.encode(encoding), logger)
+
+
+_BACKUP_TS_FORMAT = "%Y%m%d_%H%M%S"
+
+
+def _link_or_copy(src: str, dst: str) -> str:
+    """Hardlink src to dst, copying instead when linking is unsupported."""
+    try:
+        os.link(src, dst)
+    except OSError:
+        # Cross-device, unsupported filesystem, or no link permission
+        shutil.copy2(src, dst)
+    return dst
+
+
 def create_backup(path: Path, logger: logging.Logger) -> Optional[Path]:
     """Create timestamped backup of existing directory."""
     if not path.exists():
         return None
     
-    ts = datetime.now().strftime("%Y%m%d_%H%M%S")
+    ts = time.strftime(_BACKUP_TS_FORMAT)
     backup = path.parent / f"{path.name}_backup_{ts}"
     
-    import shutil
-    shutil.copytree(path, backup)
-    logger.info(f"Created backup: {backup}")
+    # Builds replace files rather than rewriting them, so links stay intact
+    shutil.copytree(path, backup, copy_function=_link_or_copy)
+    logger.info("Created backup: %s", backup)
     return backup
 
 
@@ -853,15 +1272,32 @@ def build_package(
     output_dir: Path,
     config: BuildConfig,
     logger: logging.Logger,
-    dry_run: bool = False
+    dry_run: bool = False,
+    generated_at: Optional[str] = None,
+    write_files: bool = True
 ) -> BuildManifest:
-    """Build the complete audit landing page package."""
+    """Build the complete audit landing page package.
+    
+    Encoded artifacts are kept in ``manifest.payloads`` so the ZIP can be
+    written from memory; with ``write_files=False`` nothing touches disk.
+    """
+    if generated_at is None:
+        generated_at = datetime.now(timezone.utc).isoformat(timespec="seconds")
+    # Fail before anything is written if the checksum backend is unavailable
+    artifact_checksum(b"", config)
+    
+    if config.incremental and write_files and not dry_run:
+        cached = load_cached_build(output_dir, config)
+        if cached is not None:
+            logger.info("Outputs match cached build from %s — skipping", cached.generated_at)
+            return cached
     
     manifest = BuildManifest(
         version=config.version,
         promptcore_ver=config.promptcore_ver,
-        generated_at=datetime.now(timezone.utc).isoformat(),
-        hostname=os.environ.get("COMPUTERNAME", os.environ.get("HOSTNAME", "unknown"))
+        generated_at=generated_at,
+        hostname=_HOSTNAME,
+        checksum_algo=config.checksum_algo
     )
     
     # Define paths
@@ -872,28 +1308,35 @@ def build_package(
     
     # Generate content
     logger.info("Generating content...")
-    astro_content = generate_astro_content(config)
-    schema_content = generate_schema(config)
-    css_content = generate_css()
-    readme_content = generate_readme(config)
+    astro_content, schema_content, css_content, readme_content = generate_all(
+        config, generated_at
+    )
+    # Static templates come pre-encoded; only dynamic artifacts are encoded here
+    astro = EncodedArtifact(astro_content, generate_astro_bytes(config))
+    css = EncodedArtifact(css_content, generate_css_bytes(config))
+    readme = encode_artifact(readme_content, config.encoding)
     
     # Validate before writing
     logger.info("Validating content...")
+    debug = logger.isEnabledFor(logging.DEBUG)
     
-    astro_validation = validate_astro(astro_content, config)
+    astro_validation = validate_astro(astro, config)
     manifest.validation["astro"] = astro_validation
-    for check in astro_validation["checks"]:
-        logger.debug(f"  Astro: {check}")
+    if debug:
+        for check in astro_validation["checks"]:
+            logger.debug("  Astro: %s", check)
     
     schema_validation = validate_schema(schema_content, config)
     manifest.validation["schema"] = schema_validation
-    for check in schema_validation["checks"]:
-        logger.debug(f"  Schema: {check}")
+    if debug:
+        for check in schema_validation["checks"]:
+            logger.debug("  Schema: %s", check)
     
-    css_validation = validate_css(css_content, config)
+    css_validation = validate_css(css, config)
     manifest.validation["css"] = css_validation
-    for check in css_validation["checks"]:
-        logger.debug(f"  CSS: {check}")
+    if debug:
+        for check in css_validation["checks"]:
+            logger.debug("  CSS: %s", check)
     
     # Check for validation failures
     all_passed = all([
@@ -913,28 +1356,30 @@ def build_package(
         return manifest
     
     # Write files
-    logger.info("Writing files...")
-    
-    astro_path = src_pages / f"{config.page_slug}.astro"
-    safe_write(astro_path, astro_content, config.encoding, logger)
-    manifest.artifacts["astro"] = str(astro_path)
-    manifest.checksums["astro"] = compute_checksum(astro_content)
+    if write_files:
+        logger.info("Writing files...")
+    else:
+        logger.info("ZIP-only build — skipping unpacked files")
     
-    schema_path = public / "schema-audit.json"
-    schema_str = json.dumps(schema_content, indent=2, ensure_ascii=False)
-    safe_write(schema_path, schema_str, config.encoding, logger)
-    manifest.artifacts["schema"] = str(schema_path)
-    manifest.checksums["schema"] = compute_checksum(schema_str)
+    artifacts = [
+        ("astro", src_pages / f"{config.page_slug}.astro", astro.data),
+        ("schema", public / "schema-audit.json", generate_schema_bytes(config)),
+        ("css", styles / "audit-styles.css", css.data),
+        ("readme", docs / "readme.md", readme.data),
+    ]
     
-    css_path = styles / "audit-styles.css"
-    safe_write(css_path, css_content, config.encoding, logger)
-    manifest.artifacts["css"] = str(css_path)
-    manifest.checksums["css"] = compute_checksum(css_content)
+    def _emit(item: tuple) -> tuple:
+        key, path, data = item
+        if write_files:
+            safe_write_bytes(path, data, logger)
+        return key, path, data, artifact_checksum(data, config)
     
-    readme_path = docs / "readme.md"
-    safe_write(readme_path, readme_content, config.encoding, logger)
-    manifest.artifacts["readme"] = str(readme_path)
-    manifest.checksums["readme"] = compute_checksum(readme_content)
+    # hashlib and file writes release the GIL, so the four artifacts overlap
+    with ThreadPoolExecutor(max_workers=len(artifacts)) as ex:
+        for key, path, data, checksum in ex.map(_emit, artifacts):
+            manifest.artifacts[key] = str(path)
+            manifest.checksums[key] = checksum
+            manifest.payloads[path.relative_to(output_dir).as_posix()] = data
     
     # Write manifest
     manifest_path = output_dir / "build-manifest.json"
@@ -943,35 +1388,99 @@ def build_package(
         "promptcore_ver": manifest.promptcore_ver,
         "generated_at": manifest.generated_at,
         "hostname": manifest.hostname,
+        "checksum_algo": manifest.checksum_algo,
         "artifacts": manifest.artifacts,
         "checksums": manifest.checksums,
         "validation": manifest.validation
     }
-    manifest_str = json.dumps(manifest_dict, indent=2)
-    safe_write(manifest_path, manifest_str, config.encoding, logger)
+    manifest_bytes = dumps_json_bytes(manifest_dict)
+    if not _is_utf8(config.encoding):
+        manifest_bytes = manifest_bytes.decode("utf-8").encode(config.encoding)
+    if write_files:
+        safe_write_bytes(manifest_path, manifest_bytes, logger)
+    manifest.payloads[manifest_path.name] = manifest_bytes
+    if config.incremental and write_files:
+        store_cached_build(output_dir, config, manifest_bytes)
     
     return manifest
 
 
+def resolve_compression(config: BuildConfig, logger: logging.Logger) -> tuple:
+    """Resolve the configured backend to a (compression, compresslevel) pair."""
+    if config.zip_compression is not None:
+        if config.zip_compression == zipfile.ZIP_DEFLATED:
+            return zipfile.ZIP_DEFLATED, config.deflate_level
+        if config.zip_compression == getattr(zipfile, "ZIP_ZSTANDARD", None):
+            return config.zip_compression, config.zstd_level
+        return config.zip_compression, None
+    if config.compression_backend == "zstd":
+        zstd = getattr(zipfile, "ZIP_ZSTANDARD", None)
+        if zstd is not None:
+            return zstd, config.zstd_level
+        logger.warning("Zstandard ZIP entries require Python 3.14+ — falling back to deflate")
+    elif config.compression_backend != "deflate":
+        raise ValueError(f"Unknown compression backend: {config.compression_backend}")
+    return zipfile.ZIP_DEFLATED, config.deflate_level
+
+
+def _walk_files(path) -> Iterator[str]:
+    """Yield file paths under path recursively using cached os.scandir entries."""
+    with os.scandir(path) as entries:
+        for entry in entries:
+            if entry.is_dir(follow_symlinks=False):
+                yield from _walk_files(entry.path)
+            elif entry.is_file():
+                yield entry.path
+
+
 def create_zip(
     source_dir: Path,
     output_path: Path,
     config: BuildConfig,
-    logger: logging.Logger
+    logger: logging.Logger,
+    payloads: Optional[dict] = None
 ) -> Path:
-    """Create distribution ZIP with all artifacts."""
-    logger.info(f"Creating ZIP archive: {output_path}")
+    """Create distribution ZIP with all artifacts.
     
-    with zipfile.ZipFile(output_path, "w", config.zip_compression) as zf:
-        for root, _, files in os.walk(source_dir):
-            for f in files:
-                full_path = Path(root) / f
+    When ``payloads`` (relative path -> bytes) is given, those entries are
+    written straight from memory; any other files already in ``source_dir``
+    (e.g. hand-added docs) are still read from disk, as without payloads.
+    """
+    logger.info("Creating ZIP archive: %s", output_path)
+    compression, level = resolve_compression(config, logger)
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+    debug = logger.isEnabledFor(logging.DEBUG)
+    payloads = payloads or {}
+    
+    # 1 MiB buffer amortizes the many small header/entry writes into few syscalls
+    with open(output_path, "wb", buffering=1 << 20) as fp, \
+            zipfile.ZipFile(fp, "w", compression, compresslevel=level) as zf:
+        date_time = time.localtime()[:6]
+        for rel_name, data in payloads.items():
+            # Same arcnames as the walk below, including for ``-o .``
+            arc_name = (source_dir / rel_name).relative_to(source_dir.parent).as_posix()
+            info = zipfile.ZipInfo(arc_name, date_time)
+            info.compress_type = compression
+            info.external_attr = 0o644 << 16
+            zf.writestr(info, data, compresslevel=level)
+            if debug:
+                logger.debug("  Added: %s", info.filename)
+        
+        if source_dir.is_dir():
+            archive = output_path.resolve()
+            for entry_path in _walk_files(source_dir):
+                full_path = Path(entry_path)
+                if full_path.relative_to(source_dir).as_posix() in payloads:
+                    continue
+                if full_path.resolve() == archive:
+                    continue  # -o . puts the archive inside the tree being zipped
                 arc_name = full_path.relative_to(source_dir.parent)
                 zf.write(full_path, arcname=arc_name)
-                logger.debug(f"  Added: {arc_name}")
+                if debug:
+                    logger.debug("  Added: %s", arc_name)
     
     size = output_path.stat().st_size
-    logger.info(f"ZIP created: {size:,} bytes")
+    logger.info("ZIP created: %s bytes", format(size, ","))
     return output_path
 
 
@@ -995,6 +1504,22 @@ def main():
         action="store_true",
         help="Create distribution ZIP after build"
     )
+    parser.add_argument(
+        "--zip-only",
+        action="store_true",
+        help="Write only the distribution ZIP, without the unpacked directory"
+    )
+    parser.add_argument(
+        "--compression",
+        choices=("deflate", "zstd"),
+        default="deflate",
+        help="ZIP compression backend (default: deflate; zstd needs Python 3.14+)"
+    )
+    parser.add_argument(
+        "--minify-css",
+        action="store_true",
+        help="Ship audit-styles.css minified"
+    )
     parser.add_argument(
         "--backup",
         action="store_true",
@@ -1015,19 +1540,44 @@ def main():
         action="store_true",
         help="Enable verbose output"
     )
+    parser.add_argument(
+        "-j", "--jobs",
+        type=int,
+        default=1,
+        help="Worker processes for content generation (default: 1)"
+    )
+    parser.add_argument(
+        "--checksum-algo",
+        choices=("sha256", "blake3"),
+        default="sha256",
+        help="Manifest checksum algorithm (default: sha256; blake3 needs the blake3 package)"
+    )
+    parser.add_argument(
+        "--incremental",
+        action="store_true",
+        help="Skip the build when existing outputs match the last cached build"
+    )
     
     args = parser.parse_args()
     
     # Setup
     logger = setup_logging(args.log_file)
     if args.verbose:
+        logger.setLevel(logging.DEBUG)
         logger.handlers[0].setLevel(logging.DEBUG)
     
-    config = BuildConfig()
+    build_ts = datetime.now(timezone.utc).isoformat(timespec="seconds")
+    config = BuildConfig(
+        compression_backend=args.compression,
+        jobs=args.jobs,
+        minify_css=args.minify_css,
+        incremental=args.incremental,
+        checksum_algo=args.checksum_algo
+    )
     
     logger.info("=" * 60)
-    logger.info(f"NexTara DCS Audit Builder {config.version}")
-    logger.info(f"PromptCore Alignment: {config.promptcore_ver}")
+    logger.info("NexTara DCS Audit Builder %s", config.version)
+    logger.info("PromptCore Alignment: %s", config.promptcore_ver)
     logger.info("=" * 60)
     
     try:
@@ -1036,27 +1586,30 @@ def main():
             create_backup(args.output, logger)
         
         # Build
-        manifest = build_package(args.output, config, logger, args.dry_run)
+        manifest = build_package(
+            args.output, config, logger, args.dry_run, build_ts,
+            write_files=not args.zip_only
+        )
         
         # Create ZIP if requested
-        if args.zip and not args.dry_run:
+        if (args.zip or args.zip_only) and not args.dry_run:
             zip_path = args.output.parent / f"{args.output.name}.zip"
-            create_zip(args.output, zip_path, config, logger)
+            create_zip(args.output, zip_path, config, logger, manifest.payloads)
         
         # Summary
         logger.info("=" * 60)
         logger.info("BUILD COMPLETE")
-        logger.info(f"  Output: {args.output}")
-        logger.info(f"  Artifacts: {len(manifest.artifacts)}")
+        logger.info("  Output: %s", args.output)
+        logger.info("  Artifacts: %d", len(manifest.artifacts))
         logger.info("=" * 60)
         
         return 0
         
     except ValidationError as e:
-        logger.error(f"Validation failed: {e}")
+        logger.error("Validation failed: %s", e)
         return 1
     except Exception as e:
-        logger.error(f"Build failed: {e}")
+        logger.error("Build failed: %s", e)
         return 2
 
 
@@ -0,0 +1,188 @@
+import logging
+import zipfile
+from pathlib import Path
+
+import pytest
+
+import dcs_audit_builder as builder
+
+
+@pytest.fixture
+def cached_build(tmp_path, monkeypatch):
+    """Run one incremental build into a temp dir with an isolated build cache."""
+    monkeypatch.setattr(builder, "_BUILD_CACHE_DIR", tmp_path / "cache")
+    config = builder.BuildConfig(incremental=True)
+    output_dir = tmp_path / "pkg"
+    output_dir.mkdir()
+    logger = logging.getLogger("dcs_audit_builder.test")
+    builder.build_package(output_dir, config, logger)
+    return output_dir, config
+
+
+def _zip_build(output_dir: Path, config: "builder.BuildConfig") -> zipfile.ZipFile:
+    """Build into output_dir and zip it the way main() does for --zip."""
+    logger = logging.getLogger("dcs_audit_builder.test")
+    manifest = builder.build_package(output_dir, config, logger)
+    zip_path = output_dir.parent / f"{output_dir.name}.zip"
+    builder.create_zip(output_dir, zip_path, config, logger, manifest.payloads)
+    return zipfile.ZipFile(zip_path)
+
+
+def test_load_cached_build_hit(cached_build):
+    output_dir, config = cached_build
+    manifest = builder.load_cached_build(output_dir, config)
+    assert manifest is not None
+    assert manifest.payloads["build-manifest.json"] == (
+        output_dir / "build-manifest.json"
+    ).read_bytes()
+
+
+def test_load_cached_build_tampered_manifest(cached_build):
+    output_dir, config = cached_build
+    manifest_path = output_dir / "build-manifest.json"
+    manifest_path.write_bytes(manifest_path.read_bytes() + b"\n")
+    assert builder.load_cached_build(output_dir, config) is None
+
+
+def test_load_cached_build_missing_manifest(cached_build):
+    output_dir, config = cached_build
+    (output_dir / "build-manifest.json").unlink()
+    assert builder.load_cached_build(output_dir, config) is None
+
+
+def test_load_cached_build_tampered_artifact(cached_build):
+    output_dir, config = cached_build
+    css_path = output_dir / "styles" / "audit-styles.css"
+    css_path.write_bytes(css_path.read_bytes() + b"/* x */")
+    assert builder.load_cached_build(output_dir, config) is None
+
+
+def test_load_cached_build_missing_artifact(cached_build):
+    output_dir, config = cached_build
+    (output_dir / "docs" / "readme.md").unlink()
+    assert builder.load_cached_build(output_dir, config) is None
+
+
+def test_load_cached_build_without_cache_entry(tmp_path, monkeypatch):
+    monkeypatch.setattr(builder, "_BUILD_CACHE_DIR", tmp_path / "cache")
+    assert builder.load_cached_build(Path(tmp_path), builder.BuildConfig()) is None
+
+
+def test_generate_schema_returns_independent_dicts():
+    config = builder.BuildConfig()
+    schema = builder.generate_schema(config)
+    schema["@graph"][2]["mainEntity"][0]["name"] = "mutated"
+    schema["@context"] = "mutated"
+    assert builder.generate_schema(config)["@context"] == "https://schema.org"
+    assert builder.generate_schema_bytes(config) == builder.dumps_schema(
+        builder.generate_schema(config)
+    ).encode("utf-8")
+
+
+def test_generate_readme_timestamp_is_optional():
+    config = builder.BuildConfig()
+    assert "**Generated:** 2026-01-01T00:00:00+00:00" in builder.generate_readme(
+        config, "2026-01-01T00:00:00+00:00"
+    )
+    assert config.version in builder.generate_readme(config)
+
+
+def test_create_zip_keeps_files_outside_the_payloads(tmp_path):
+    output_dir = tmp_path / "pkg"
+    (output_dir / "docs").mkdir(parents=True)
+    (output_dir / "docs" / "dcs-framework.md").write_text("# Framework\n")
+    with _zip_build(output_dir, builder.BuildConfig()) as zf:
+        names = zf.namelist()
+        assert "pkg/docs/dcs-framework.md" in names
+        assert "pkg/docs/readme.md" in names
+        assert len(names) == len(set(names)) == 6
+        assert zf.read("pkg/docs/dcs-framework.md") == b"# Framework\n"
+
+
+def test_create_zip_arcnames_for_current_directory(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    with _zip_build(Path("."), builder.BuildConfig()) as zf:
+        names = zf.namelist()
+    assert "docs/readme.md" in names
+    assert "build-manifest.json" in names
+    assert not any(name.startswith("/") for name in names)
+    assert ".zip" not in names
+
+
+@pytest.mark.parametrize("types", [
+    ("WebPage", "Service"),
+    ["WebPage", "Service"],
+    frozenset({"WebPage", "Service"}),
+])
+def test_validate_schema_accepts_any_required_types_iterable(types):
+    config = builder.BuildConfig(required_schema_types=types)
+    result = builder.validate_schema(builder.generate_schema(config), config)
+    assert result["passed"]
+    assert sorted(result["checks"][1:]) == [
+        "PASS: Contains Service", "PASS: Contains WebPage"
+    ]
+
+
+def test_validate_schema_reports_types_in_declared_order():
+    config = builder.BuildConfig()
+    result = builder.validate_schema({"@context": "https://schema.org"}, config)
+    assert result["checks"][1:] == [
+        "FAIL: Missing WebPage", "FAIL: Missing Service", "FAIL: Missing FAQPage"
+    ]
+
+
+def test_safe_write_bytes_removes_temp_file_on_failure(tmp_path):
+    target = tmp_path / "f.txt"
+    target.mkdir()  # os.replace cannot put a file over a directory
+    with pytest.raises(OSError):
+        builder.safe_write_bytes(target, b"data", logging.getLogger("dcs_audit_builder.test"))
+    assert sorted(p.name for p in tmp_path.iterdir()) == ["f.txt"]
+
+
+def test_rebuild_leaves_hardlinked_backup_untouched(tmp_path):
+    logger = logging.getLogger("dcs_audit_builder.test")
+    output_dir = tmp_path / "pkg"
+    builder.build_package(output_dir, builder.BuildConfig(), logger)
+    before = {p: p.read_bytes() for p in output_dir.rglob("*") if p.is_file()}
+    
+    backup = builder.create_backup(output_dir, logger)
+    assert (backup / "build-manifest.json").stat().st_nlink == 2
+    builder.build_package(
+        output_dir, builder.BuildConfig(domain="https://example.com", minify_css=True), logger
+    )
+    
+    for path, data in before.items():
+        rel = path.relative_to(output_dir)
+        assert (backup / rel).read_bytes() == data
+    assert (output_dir / "public" / "schema-audit.json").read_bytes() != (
+        before[output_dir / "public" / "schema-audit.json"]
+    )
+
+
+def test_minified_css_passes_validation():
+    config = builder.BuildConfig(minify_css=True)
+    css = builder.encode_artifact(builder.generate_css(minify=True), config.encoding)
+    assert len(css.data) < len(builder.generate_css_bytes(builder.BuildConfig()))
+    assert builder.validate_css(css, config)["passed"]
+
+
+def test_minify_css_keeps_strings_and_urls():
+    css = (
+        'a::before { content: "x  /* y */  ;}" ; }\n'
+        "/* note */ b > c , d { background: url(data:image/svg+xml;base64,AA==) ; }"
+    )
+    assert builder._minify_css(css) == (
+        'a::before{content: "x  /* y */  ;}"}'
+        "b>c,d{background: url(data:image/svg+xml;base64,AA==)}"
+    )
+
+
+def test_build_cache_key_ignores_settings_that_do_not_change_outputs(tmp_path):
+    base = builder.BuildConfig(incremental=True)
+    key = builder._build_cache_path(tmp_path, base)
+    for changes in ({"jobs": 4}, {"compression_backend": "zstd"}, {"deflate_level": 9},
+                    {"zstd_level": 3}, {"zip_compression": zipfile.ZIP_STORED}):
+        assert builder._build_cache_path(tmp_path, builder.BuildConfig(incremental=True, **changes)) == key
+    for changes in ({"minify_css": True}, {"domain": "https://example.com"},
+                    {"checksum_algo": "blake3"}, {"required_schema_types": ("WebPage",)}):
+        assert builder._build_cache_path(tmp_path, builder.BuildConfig(incremental=True, **changes)) != key